@@ -1,56 +1,61 @@
-import logging
-import os
-import typer
-from .apps.vcard import app as vcard_app
-from .apps.feeds.app import app as feeds_app
-from .apps.connections.app import app as connections_app
-from .apps.key import app as key_app
-
-main_app = typer.Typer(
-    help="DSI Tools: A collection of CLI tools for working with vCards, feeds, connections, and keys"
-)
-
-# Add the apps as a subcommands to the main app
-main_app.add_typer(vcard_app, name="vcard", help="Commands related to vCard processing")
-main_app.add_typer(feeds_app, name="feeds", help="Commands related to feeds processing")
-main_app.add_typer(
-    connections_app,
-    name="connections",
-    help="Commands related to connections processing",
-)
-main_app.add_typer(
-    key_app,
-    name="key",
-    help="Commands related to keys",
-)
-
-
-# If no subcommand is provided, show the help message
-@main_app.callback(invoke_without_command=True)
-def callback(ctx: typer.Context):
-    if ctx.invoked_subcommand is None:
-        typer.echo(ctx.get_help())
-
-    # Set up logging for the entire application context
-    # ctx.logger = logging.getLogger(__name__)
-
-    # ctx.logger.setLevel(logging.INFO)
-
-    # # Avoid adding handlers multiple times if the logger is reused
-    # if not ctx.logger.handlers:
-    #     handler = logging.StreamHandler()
-    #     handler.setLevel(logging.INFO)
-
-    #     formatter = logging.Formatter(
-    #         # "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    #         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    #     )
-    #     handler.setFormatter(formatter)
-
-    #     ctx.logger.addHandler(handler)
-
-    # ctx.obj = {"config_path": "config.toml", "verbose": True, "logger": ctx.logger}
-
+import importlib
+import sys
+
+HELP = "DSI Tools: A collection of CLI tools for working with vCards, feeds, connections, and keys"
+
+# Subcommands dispatched by the first argument. Only the module of the selected
+# subcommand is imported, so unrelated apps (and their dependencies) are not loaded.
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "vcard": (".apps.vcard", "Commands related to vCard processing"),
+    "feeds": (".apps.feeds.app", "Commands related to feeds processing"),
+    "connections": (
+        ".apps.connections.app",
+        "Commands related to connections processing",
+    ),
+    "key": (".apps.key", "Commands related to keys"),
+}
+
+
+def get_help() -> str:
+    """Build the help message of the main app."""
+    width = max(len(name) for name in SUBCOMMANDS)
+    commands = "\n".join(
+        f"  {name.ljust(width)}  {description}"
+        for name, (_, description) in SUBCOMMANDS.items()
+    )
+    return f"Usage: dsipy COMMAND [ARGS]...\n\n{HELP}\n\nCommands:\n{commands}"
+
+
+def main_app(args: list[str] | None = None):
+    """
+    Entry point of the CLI. Run the subcommand app selected by the first argument.
+    Args:
+        args (list[str] | None): Command line arguments. Defaults to sys.argv[1:].
+    """
+    if args is None:
+        args = sys.argv[1:]
+
+    cmd = args[0] if args else None
+
+    # If no subcommand is provided, show the help message
+    if cmd is None or cmd in ("--help", "-h"):
+        print(get_help())
+        return
+
+    if cmd not in SUBCOMMANDS:
+        print(f"❌ No such command '{cmd}'.\n", file=sys.stderr)
+        print(get_help(), file=sys.stderr)
+        sys.exit(2)
+
+    module, description = SUBCOMMANDS[cmd]
+    app = importlib.import_module(module, __package__).app
+    # Always run the app as a group, as when it was added with add_typer, so the
+    # name of the command is required even if the app has a single one
+    from typer.main import get_group
+
+    group = get_group(app)
+    group.help = description
+    group(args[1:], prog_name=f"dsipy {cmd}")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
-from functools import wraps
+import itertools
+import os
+import sys
+import tempfile
 from typing import List
 from pathlib import Path
 import typer
 from ...shared.cli import Cli
-from ...shared.vcard import generate_opml_from_vcards, VCardInputs
+from ...shared.vcard import iter_opml_from_vcards, VCardInputs
 
 app = Cli(help="A CLI tool to the connections", no_args_is_help=True)
 
@@ -24,15 +27,33 @@ def feed(
         )
         raise typer.Exit()
 
-    opml = generate_opml_from_vcards(vcard_inputs.vcard_files)
+    # Stream the OPML fragments. The first one is taken before writing anything,
+    # so the output file is not created when no vCard has a feed URL.
+    fragments = iter_opml_from_vcards(vcard_inputs.vcard_files)
+    opml = itertools.chain([next(fragments)], fragments)
 
     # Write the OPML to the output file
     if output:
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(opml, encoding="utf-8")
+        # Write to a temporary file that replaces the output once complete, so a
+        # failure while reading the vCards does not leave a truncated OPML file
+        fd, temp_output = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.")
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                # mkstemp creates the file readable by the owner only, use the
+                # default mode of new files instead
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temp_output, 0o666 & ~umask)
+                f.writelines(opml)
+            os.replace(temp_output, output)
+        except BaseException:
+            os.unlink(temp_output)
+            raise
         typer.secho(f"✅ OPML file generated: {output}")
     else:
-        print(opml)
+        sys.stdout.writelines(opml)
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
@@ -3,19 +3,9 @@ import difflib
 from functools import wraps
 import os
 from pathlib import Path
-from rich.progress import Progress
-from rich.syntax import Syntax
 import typer
 from typing import List
-from .lib.feed import RSSFeed
-from .lib.markdown import get_feed_class
 from ...shared.cli import Cli
-from ...shared.publish import get_publisher
-from ...shared.security import (
-    load_private_key_pem,
-    load_public_key_pem,
-    public_key_to_b64der,
-)
 from ...shared.utils import slugify
 
 
@@ -44,6 +34,15 @@ def get_option_value(
     return current_value
 
 
+def read_key_option(value: str) -> bytes:
+    """
+    Get the PEM data of a key option, which is either the path to a PEM file or the PEM content itself.
+    """
+    if os.path.isfile(value):
+        return Path(value).read_bytes()
+    return value.encode()
+
+
 app = Cli(help="A CLI tool to generate RSS feeds from feed files", no_args_is_help=True)
 
 
@@ -63,6 +62,7 @@ def new(
         "markdown", "--type", help="Define the type of feed to create"
     ),
 ):
+    from .lib.markdown import get_feed_class
 
     feed_class = get_feed_class(feed_type)
 
@@ -109,28 +109,28 @@ def new(
 
 
 # @app.command()
-def option_value_decorator(
-    option_name: str, prompt_message: str, default_value: str, interactive: bool
-):
+def option_values_decorator(options: list[tuple[str, str, str, bool]]):
     """
-    A decorator to inject or validate an option value for a command.
+    A decorator to inject or validate option values for a command.
+    Args:
+        options (list): (option_name, prompt_message, default_value, interactive) of each option, in prompt order.
     """
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            current_value = kwargs.get(option_name)
-            if not current_value:
-                if interactive:
-                    kwargs[option_name] = typer.prompt(
-                        prompt_message, default=default_value, show_default=True
-                    )
-                else:
-                    typer.secho(
-                        f"❌ The {option_name} cannot be empty. Please provide a {option_name} using the --{option_name} option.",
-                        fg=typer.colors.RED,
-                    )
-                    raise typer.Exit()
+            for option_name, prompt_message, default_value, interactive in options:
+                if not kwargs.get(option_name):
+                    if interactive:
+                        kwargs[option_name] = typer.prompt(
+                            prompt_message, default=default_value, show_default=True
+                        )
+                    else:
+                        typer.secho(
+                            f"❌ The {option_name} cannot be empty. Please provide a {option_name} using the --{option_name} option.",
+                            fg=typer.colors.RED,
+                        )
+                        raise typer.Exit()
             return func(*args, **kwargs)
 
         return wrapper
@@ -139,23 +139,29 @@ def option_value_decorator(
 
 
 @app.command()
-@option_value_decorator(
-    "title", "Provide the title for the RSS feed", "My RSS Feed", True
-)
-@option_value_decorator(
-    "link", "Provide the base link for the RSS feed items", "https://example.com", True
-)
-@option_value_decorator(
-    "description",
-    "Provide the description for the RSS feed",
-    "This is my RSS feed",
-    True,
-)
-@option_value_decorator(
-    "author", "Provide the author name for the RSS feed", "Author Name", True
-)
-@option_value_decorator(
-    "email", "Provide the author email for the RSS feed", "author@email.com", True
+@option_values_decorator(
+    [
+        ("title", "Provide the title for the RSS feed", "My RSS Feed", True),
+        (
+            "link",
+            "Provide the base link for the RSS feed items",
+            "https://example.com",
+            True,
+        ),
+        (
+            "description",
+            "Provide the description for the RSS feed",
+            "This is my RSS feed",
+            True,
+        ),
+        ("author", "Provide the author name for the RSS feed", "Author Name", True),
+        (
+            "email",
+            "Provide the author email for the RSS feed",
+            "author@email.com",
+            True,
+        ),
+    ]
 )
 def build(
     directory: str = typer.Argument(
@@ -194,54 +200,22 @@ def build(
         None, "--var-file", help="File with template variables (one KEY=VALUE per line)"
     )
 ):
+    from .lib.feed import RSSFeed
+    from .lib.markdown import get_feed_class
+    from ...shared.security import (
+        load_private_key_pem,
+        load_public_key_pem,
+        public_key_to_b64der,
+    )
 
     feed_class = get_feed_class(feed_type)
 
-    link = get_option_value(
-        "link",
-        link,
-        "Provide the base link for the RSS feed items",
-        "https://example.com",
-        interactive,
-    )
-    description = get_option_value(
-        "description",
-        description,
-        "Provide the description for the RSS feed",
-        "This is my RSS feed",
-        interactive,
-    )
-    author = get_option_value(
-        "author",
-        author,
-        "Provide the author name for the RSS feed",
-        "Author Name",
-        interactive,
-    )
-    email = get_option_value(
-        "email",
-        email,
-        "Provide the author email for the RSS feed",
-        "author@email.com",
-        interactive,
-    )
-
     sign = None
 
     if signing_key_priv_file and signing_key_public_file:
-        priv_key_data = None
-        pub_key_data = None
+        priv_key_data = read_key_option(signing_key_priv_file)
+        pub_key_data = read_key_option(signing_key_public_file)
 
-        if os.path.isfile(signing_key_priv_file):
-            priv_key_data = Path(signing_key_priv_file).read_bytes()
-        else:
-            priv_key_data = signing_key_priv_file.encode()
-
-        if os.path.isfile(signing_key_public_file):
-            pub_key_data = Path(signing_key_public_file).read_bytes()
-        else:
-            pub_key_data = signing_key_public_file.encode()
-            
         if priv_key_data and pub_key_data:
             sign = {
                 "key": load_private_key_pem(priv_key_data),
@@ -304,7 +278,7 @@ def build(
 
     if output:
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(feed_content, encoding="utf-8")
+        output.write_bytes(feed_content.encode("utf-8"))
         typer.secho(f"✅ RSS feed generated: {output}", fg=typer.colors.GREEN)
     else:
         print(feed_content)
@@ -339,6 +313,9 @@ def publish(
     """
     Publish feeds to multiple providers (GitHub, S3, WebDAV, local).
     """
+    from rich.progress import Progress
+    from rich.syntax import Syntax
+    from ...shared.publish import get_publisher
 
     # Parse provider args
     kwargs = {}
@@ -1,121 +1,140 @@
-from requests.compat import basestring
-from rfeed import Feed, Item, Extension, Guid, Serializable
+from xml.sax.saxutils import escape, quoteattr
 from ....shared.security import sign_feed_item
 
-
-class RSSFeedAtomLinkNamespace(Extension):
-    """Custom extension to add the Atom namespace to the RSS feed."""
-
-    def get_namespace(self):
-        return {"xmlns:atom": "http://www.w3.org/2005/Atom"}
-
-
-class RSSFeedAtomLink(Serializable):
-    """Custom tag for adding an Atom link to the RSS feed."""
-
-    def __init__(self, href):
-        Serializable.__init__(self)
-        self.href = href
-
-    def publish(self, handler):
-        Serializable.publish(self, handler)
-        self._write_element("atom:link", None, {"href": self.href, "rel": "self"})
-
-class RSSFeedMediaContent(Serializable):
-    """Custom tag for adding a media image to the RSS feed.
-    <media:content
-        url="https://example.com/video.mp4" 
-        type="video/mp4" 
-        medium="video" 
-        duration="91"
-    >    
+RSS_NAMESPACES = {
+    "xmlns:dc": "http://purl.org/dc/elements/1.1/",
+    "xmlns:atom": "http://www.w3.org/2005/Atom",
+}
+RSS_GENERATOR = "dsipy"
+RSS_DOCS = "https://www.rssboard.org/rss-specification"
+
+# URL extension -> (type, medium) of the media:content tag
+MEDIA_TYPES = {
+    ".jpg": ("image/jpeg", "image"),
+    ".jpeg": ("image/jpeg", "image"),
+    ".png": ("image/png", "image"),
+    ".gif": ("image/gif", "image"),
+    ".webp": ("image/webp", "image"),
+    ".mp4": ("video/mp4", "video"),
+}
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+def rss_date(date) -> str | None:
+    """Format a datetime in GMT as an RFC 822 date. Returns None if no date is provided."""
+    if date is None:
+        return None
+    return (
+        f"{WEEKDAYS[date.weekday()]}, {date.day:02d} {MONTHS[date.month - 1]} "
+        f"{date.year:04d} {date.hour:02d}:{date.minute:02d}:{date.second:02d} GMT"
+    )
+
+
+def xml_element(name: str, value=None, attributes: dict | None = None) -> str:
+    """
+    Serialize an XML element with escaped text and attributes.
+    Elements without value and attributes are omitted (empty string).
+    """
+    if value is None and not attributes:
+        return ""
+    attrs = (
+        "".join(f" {key}={quoteattr(val)}" for key, val in attributes.items())
+        if attributes
+        else ""
+    )
+    text = "" if value is None else escape(str(value))
+    return f"<{name}{attrs}>{text}</{name}>"
+
+
+def xml_cdata_element(name: str, value=None) -> str:
     """
+    Serialize an XML element whose value may contain a CDATA section, which is
+    written as raw XML instead of being escaped. This allows HTML in the RSS description.
+    """
+    if value is None:
+        return ""
+    value = str(value)
+    cdata_start = value.find("<![CDATA[")
+    cdata_end = value.find("]]>")
+    if cdata_start > -1 and cdata_end > -1 and cdata_start < cdata_end:
+        text = (
+            escape(value[:cdata_start])
+            + value[cdata_start : cdata_end + 3]
+            + escape(value[cdata_end + 3 :])
+        )
+    else:
+        text = escape(value)
+    return f"<{name}>{text}</{name}>"
+
 
-    def __init__(self, url):
-        super().__init__()
-        self.url = url
-        self.type = None
-        self.medium = None
-
-        if url.endswith(".jpg") or url.endswith(".jpeg"):
-            self.type = "image/jpeg"
-            self.medium = "image"
-        elif url.endswith(".png"):
-            self.type = "image/png"
-            self.medium = "image"
-        elif url.endswith(".gif"):
-            self.type = "image/gif"
-            self.medium = "image"
-        elif url.endswith(".webp"):
-            self.type = "image/webp"
-            self.medium = "image"
-        elif url.endswith(".mp4"):
-            self.type = "video/mp4"
-            self.medium = "video"
-        else:
-            self.type = "application/octet-stream"
-            self.medium = "unknown"
-
-    def publish(self, handler):
-        Serializable.publish(self, handler)
-        self._write_element("media:content", None, {"url": self.url, "type": self.type, "medium": self.medium})
-
-
-class RSSFeedSignature(Serializable):
+def media_content_element(url: str) -> str:
     """
-    Custom tag for adding a signature to an RSS item.
+    Serialize a media:content tag for the image of an RSS item.
+    <media:content url="https://example.com/video.mp4" type="video/mp4" medium="video">
     """
+    type, medium = next(
+        (media for ext, media in MEDIA_TYPES.items() if url.endswith(ext)),
+        ("application/octet-stream", "unknown"),
+    )
+    return xml_element(
+        "media:content", None, {"url": url, "type": type, "medium": medium}
+    )
 
-    def __init__(self, signature_value, key_id):
-        super().__init__()
-        self.signature_value = signature_value
-        self.key_id = key_id
-
-    def publish(self, handler):
-        super().publish(handler)
-        self._write_element(
-            "signature",
-            self.signature_value,
-            {"keyId": self.key_id},
-        )
 
-class RSSFeedContentItem(Serializable):
-    def __init__(self, content):
-        super().__init__()
-        self.content = content
-
-    def publish(self, handler):
-        super().publish(handler)
-        self._write_element("content:encoded", self.content)
-
-class RSSFeedItemCDATAPatch(Item):
-
-    def _write_element(self, name, value, attributes=None):
-        
-        if attributes is None:
-            attributes = {}
-        if value is not None or attributes != {}:
-            self.handler.startElement(name, attributes)
-
-            if value is not None:
-                """This is a patch to allow CDATA sections in the description field. If the value contains a CDATA section, we need to write it as raw XML instead of escaping it."""
-
-                str_value = value if isinstance(value, basestring) else str(value)
-                if name == "description" and value is not None:
-                    cdata_start = str_value.find("<![CDATA[")
-                    cdata_end = str_value.find("]]>")
-
-                    if cdata_start > -1 and cdata_end > -1 and cdata_start < cdata_end:
-                        self.handler._write(str_value[:cdata_start])
-                        self.handler._write(str_value[cdata_start:cdata_end + 3])
-                        self.handler._write(str_value[cdata_end + 3:])
-                    else:
-                        self.handler.characters(str_value)
-                else:
-                    self.handler.characters(str_value)
-
-            self.handler.endElement(name)
 class RSSFeed:
+    @staticmethod
+    def _build_item(
+        item: dict,
+        link: str,
+        author: str,
+        signing_key=None,
+        signature_attributes: dict | None = None,
+    ) -> str:
+        """Serialize a feed item, signing it if a signing key is provided."""
+        # https://docs.python.org/3/library/datetime.html#strftime-and-strptime-behavior
+        id = item["id"] # TODO: the path needs to be changed
+        pub_date = item["date"]
+        item_description = item.get("content")
+        item_title = item.get("title")
+
+        item_extensions = ""
+        if signing_key:
+            signature_value = sign_feed_item(
+                signing_key, pub_date, item_title, item_description
+            )
+            item_extensions += xml_element(
+                "signature", signature_value, signature_attributes
+            )
+        if item.get("image"):
+            item_extensions += media_content_element(item["image"])
+
+        return (
+            "<item>"
+            + xml_element("title", item_title)
+            + xml_element("link", item.get("link") or f"{link}/feed/{id}")
+            + xml_cdata_element("description", item_description)
+            + xml_element("author", author)
+            + xml_element("pubDate", rss_date(pub_date))
+            + xml_element("guid", id, {"isPermaLink": "false"})
+            + item_extensions
+            + "</item>"
+        )
+
     @staticmethod
     def build(
         title: str,
@@ -130,53 +149,44 @@ class RSSFeed:
     ):
         """Generate a feed from the given items and metadata."""
 
-        feed_items = []
-        for item in items:
-            # https://docs.python.org/3/library/datetime.html#strftime-and-strptime-behavior
-            id = item["id"] # TODO: the path needs to be changed
-            pub_date = item["date"]
-            item_description = item.get("content")
-            item_title = item.get("title")
-
-            signature_value = None
-            signature_id = None
-
-            if sign:
-                signature_value = (
-                    sign_feed_item(sign["key"], pub_date, item_title, item_description)
-                    if sign["key"]
-                    else None
-                )
-                signature_id = sign["id"] if sign["id"] else None
-
-            item_extensions = []
-            if signature_value and signature_id:
-                item_extensions.append(RSSFeedSignature(signature_value, sign["id"]))
-            if item.get("image"):
-                item_extensions.append(RSSFeedMediaContent(item["image"]))
-
-            feed_items.append(
-                RSSFeedItemCDATAPatch(
-                    title=item_title,
-                    link=item.get("link") or f"{link}/feed/{id}",
-                    description=item_description,
-                    author=f"{author_name} ({author_email})",
-                    guid=Guid(id, False),
-                    pubDate=pub_date,
-                    extensions=item_extensions,
-                )
-            )
-        feed = Feed(
-            title=title,
-            link=link,
-            description=description,
-            language=language,
-            lastBuildDate=build_date,
-            items=feed_items,
-            extensions=[RSSFeedAtomLinkNamespace(), RSSFeedAtomLink(link)],
+        for name, value in (
+            ("title", title),
+            ("link", link),
+            ("description", description),
+        ):
+            if value is None:
+                raise ValueError(f'"{name}" must be defined')
+
+        # Invariant across the items
+        author = f"{author_name} ({author_email})"
+        signing_key = sign["key"] if sign and sign["id"] else None
+        signature_attributes = {"keyId": sign["id"]} if signing_key else None
+
+        feed_items = "".join(
+            RSSFeed._build_item(item, link, author, signing_key, signature_attributes)
+            for item in items
+        )
+
+        rss_attributes = "".join(
+            f" {key}={quoteattr(value)}"
+            for key, value in {"version": "2.0", **RSS_NAMESPACES}.items()
+        )
+        channel = (
+            xml_element("title", title)
+            + xml_element("link", link)
+            + xml_element("description", description)
+            + xml_element("language", language)
+            + xml_element("lastBuildDate", rss_date(build_date))
+            + xml_element("generator", RSS_GENERATOR)
+            + xml_element("docs", RSS_DOCS)
+            + xml_element("atom:link", None, {"href": link, "rel": "self"})
+            + feed_items
         )
 
-        return feed.rss()
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f"<rss{rss_attributes}><channel>{channel}</channel></rss>"
+        )
 
     def replace_template_variables(content: str, metadata: dict, vars_dict: dict):
         """
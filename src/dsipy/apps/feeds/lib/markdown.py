@@ -1,10 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 import os
 import datetime
-import markdown
+import json
 from pathlib import Path
+from ....shared.file import iter_files
 from ....shared.utils import slugify
 import typer
 
+# Parsed states are cached between builds, keyed by file path, mtime and size
+CACHE_FILE = Path(".dsipy-cache") / "parsed.json"
+
 
 def get_feed_class(format):
     if format == "markdown":
@@ -14,34 +19,56 @@ def get_feed_class(format):
 
 
 class MarkdownFeed:
-    def _parse_frontmatter(lines: list) -> tuple[dict, list]:
+    def _parse_frontmatter(file) -> tuple[dict, str]:
         """
-        Extract frontmatter and content lines from markdown file lines.
-        Parses YAML-like front matter delimited by --- markers.
+        Extract frontmatter and content from an open markdown file.
+        Parses YAML-like front matter delimited by --- markers, reading the file
+        line by line only until the closing marker.
         Supports any attributes in the format "key: value".
         Args:
-            lines (list): List of lines from the markdown file.
+            file: Markdown file opened in text mode.
         Returns:
-            tuple: (frontmatter_dict, content_lines_list)
+            tuple: (frontmatter_dict, content)
         """
         frontmatter = {}
-        content_lines = []
 
         # Detect front matter
-        if lines and lines[0].strip() == "---":
-            i = 1
-            while i < len(lines) and lines[i].strip() != "---":
-                line = lines[i].strip()
+        first_line = file.readline()
+        if first_line.strip() == "---":
+            for line in file:
+                line = line.strip()
+                if line == "---":
+                    break
                 # Parse any "key: value" format
-                if ":" in line:
-                    key, value = line.split(":", 1)
+                key, separator, value = line.partition(":")
+                if separator:
                     frontmatter[key.strip()] = value.strip()
-                i += 1
-            content_lines = lines[i + 1 :]
+            content = file.read()
         else:
-            content_lines = lines
+            content = first_line + file.read()
+
+        # Keep the content without the trailing line break
+        return frontmatter, content.removesuffix("\n")
 
-        return frontmatter, content_lines
+    def _parse_date(value: str) -> datetime.datetime:
+        """
+        Parse the date of a state in ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ).
+        Dates that are not strict ISO (e.g. not zero-padded) fall back to strptime.
+        Dates are returned as naive UTC datetimes so they can be compared when sorting.
+        Args:
+            value (str): The date in ISO format.
+        Returns:
+            datetime: The parsed date.
+        """
+        try:
+            date = datetime.datetime.fromisoformat(value.removesuffix("Z"))
+        except ValueError:
+            return datetime.datetime.strptime(
+                value, "%Y-%m-%dT%H:%M:%SZ" if "T" in value else "%Y-%m-%d"
+            )
+        if date.tzinfo:
+            date = date.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return date
 
     def _parse_file(path: Path) -> dict:
         """
@@ -78,8 +105,8 @@ class MarkdownFeed:
             dict: A dictionary containing the extracted metadata and content.
         """
         
-        lines = path.read_text(encoding="utf-8").splitlines()
-        metadata, content_lines = MarkdownFeed._parse_frontmatter(lines)
+        with open(path, encoding="utf-8") as file:
+            metadata, raw_content = MarkdownFeed._parse_frontmatter(file)
 
         # Fallback title
         if not metadata.get("title"):
@@ -97,21 +124,18 @@ class MarkdownFeed:
         metadata["file_dir"] = os.path.dirname(path)
         metadata["file_ext"] = os.path.splitext(path)[1]
 
-        raw_content = "\n".join(content_lines)
         content = raw_content
 
         use_html_content = metadata.get("use_html_content", "false").lower() in ["true", "yes"]
         if use_html_content:
+            import markdown
+
             content = markdown.markdown(raw_content, extensions=['extra'])
 
         return {
             "id": metadata.get("id") or slugify(str(metadata["file_path"])),
             "title": metadata["title"],
-            "date": (
-                datetime.datetime.strptime(metadata["date"], "%Y-%m-%dT%H:%M:%SZ")
-                if "T" in metadata["date"]
-                else datetime.datetime.strptime(metadata["date"], "%Y-%m-%d")
-            ),
+            "date": MarkdownFeed._parse_date(metadata["date"]),
             "link": metadata.get("link", None),
             "image": metadata.get("image", None),
             "content": content,
@@ -130,18 +154,14 @@ class MarkdownFeed:
         Returns:
             str: The complete content for the markdown file, including front matter and message.
         """
-        attributes = {"title": title if title else None, "date": date}
-
         # Only include attributes that have a value (non-empty)
-        front_matter = "\n".join(
-            f"{key}: {value}" for key, value in attributes.items() if value
-        )
+        front_matter = []
+        if title:
+            front_matter.append(f"title: {title}")
+        if date:
+            front_matter.append(f"date: {date}")
 
-        return f"""---
-{front_matter}
----
-{message}
-"""
+        return "---\n" + "\n".join(front_matter) + f"\n---\n{message}\n"
 
     def create_state(
         destination: str, title: str, message: str, date: str | None = None
@@ -156,15 +176,59 @@ class MarkdownFeed:
             f.write(content)
         typer.secho(f"✅ New post created: {destination}", fg=typer.colors.GREEN)
 
+    def _load_cache() -> dict:
+        """
+        Load the cache of parsed states, grouped by source directory. A missing or
+        invalid cache is empty.
+        """
+        try:
+            cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(cache: dict):
+        """Save the cache of parsed states. Failing to write it is not an error."""
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CACHE_FILE.write_text(
+                json.dumps(cache, ensure_ascii=False), encoding="utf-8"
+            )
+        except OSError:
+            pass
+
     def collect(directory: str):
-        md_files = [
-            Path(root) / f
-            for root, _, files in os.walk(directory)
-            for f in files
-            if f.endswith(".md")
+        md_files = list(iter_files(directory, (".md",)))
+
+        caches = MarkdownFeed._load_cache()
+        # Each directory has its own entries, so building a feed does not evict the
+        # entries of the other directories
+        directory_key = str(Path(directory))
+        cache = caches.get(directory_key)
+        if not isinstance(cache, dict):
+            cache = {}
+        keys = []
+        for f in md_files:
+            stat = f.stat()
+            keys.append(f"{f}:{stat.st_mtime_ns}:{stat.st_size}")
+
+        # Read and render the changed files concurrently to overlap the file I/O
+        missing = [(key, f) for key, f in zip(keys, md_files) if key not in cache]
+        if missing:
+            with ThreadPoolExecutor() as executor:
+                parsed = executor.map(MarkdownFeed._parse_file, [f for _, f in missing])
+                for (key, _), state in zip(missing, parsed):
+                    cache[key] = {**state, "date": state["date"].isoformat()}
+
+        # Drop the entries of removed or modified files
+        if missing or len(cache) != len(keys):
+            caches[directory_key] = {key: cache[key] for key in keys}
+            MarkdownFeed._save_cache(caches)
+
+        states = [
+            {**cache[key], "date": datetime.datetime.fromisoformat(cache[key]["date"])}
+            for key in keys
         ]
-
-        states = [MarkdownFeed._parse_file(f) for f in md_files]
         states.sort(key=lambda x: x["date"], reverse=True)
 
         return states
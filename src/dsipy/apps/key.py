@@ -2,12 +2,6 @@ from pathlib import Path
 import sys
 import typer
 from ..shared.cli import Cli
-from ..shared.security import (
-    action_generate_keypair,
-    load_public_key_pem,
-    public_key_to_b64der,
-    b64der_to_public_key,
-)
 
 app = Cli(
     help="A CLI tool to generate RSS feeds from markdown files", no_args_is_help=True
@@ -23,6 +17,8 @@ def create(
         "public.pem", "--pub", help="Path to save the public key PEM file"
     ),
 ):
+    from ..shared.security import action_generate_keypair
+
     action_generate_keypair(priv, pub)
 
 
@@ -32,6 +28,8 @@ def create(
 def pub_encode(
     file: Path = typer.Argument(..., help="Path to the public key PEM file to convert")
 ):
+    from ..shared.security import load_public_key_pem, public_key_to_b64der
+
     if not file.is_file():
         typer.secho(f"❌ '{file}' is not a file.", fg=typer.colors.RED)
         raise typer.Exit()
@@ -49,6 +47,8 @@ def pub_decode(
         None, help="Base64-encoded DER content to decode and display as PEM"
     ),
 ):
+    from ..shared.security import b64der_to_public_key
+
     if content is None:
         content = sys.stdin.read().strip()
 
@@ -1,18 +1,11 @@
 from datetime import datetime
-import difflib
 import os
 from pathlib import Path
-from rich.progress import Progress
-from rich.syntax import Syntax
+import signal
 import sys
 import typer
 from typing import List
 from ..shared.cli import Cli
-from ..shared.qr import generate_qr
-from ..shared.security import (
-    action_generate_keypair,
-    load_private_key_pem,
-)
 from ..shared.vcard import VCard, VCardInputs, vcard_main_attributes
 
 app = Cli(
@@ -107,7 +100,8 @@ def create(
     Generate a vCard by asking the user for information.
     """
 
-    custom_attributes = {}
+    # Custom attributes as (name, value) pairs, turned into a dict once at the end
+    custom_attributes_list = []
     # Prompt the user for vCard fields if interactive mode is enabled
     if interactive:
         typer.secho("Let's create a new vCard!", fg=typer.colors.CYAN)
@@ -121,148 +115,182 @@ def create(
                     key, value = line.strip().split("=", 1)
                     temp_data[key] = value
 
-        def save_entry_temp(key, value):
-            """Save a single entry to the temp file."""
-            temp_data[key] = value
-            with open(temp_file, "w", encoding="utf-8") as f:
-                for k, v in temp_data.items():
-                    f.write(f"{k}={v}\n")
+        def save_temp():
+            """Save all the entries to the temp file at once, replacing it atomically."""
+            if not temp_data:
+                return
+            with open(f"{temp_file}.tmp", "w", encoding="utf-8") as f:
+                f.writelines(f"{k}={v}\n" for k, v in temp_data.items())
+            os.replace(f"{temp_file}.tmp", temp_file)
 
         def prompt_with_temp(key, description, default):
-            """Prompt the user and save the value to the temp file."""
+            """Prompt the user and keep the value for the temp file."""
             value = typer.prompt(description, default=temp_data.get(key, default))
-            save_entry_temp(key, value)
+            temp_data[key] = value
             return value
 
-        fn = prompt_with_temp("fn", vcard_main_attributes["fn"]["description"], fn)
-        n = prompt_with_temp("n", vcard_main_attributes["n"]["description"], n)
-        nickname = prompt_with_temp(
-            "nickname", vcard_main_attributes["nickname"]["description"], nickname
-        )
-        lang = prompt_with_temp(
-            "lang", vcard_main_attributes["lang"]["description"], lang
-        )
-        gender = prompt_with_temp(
-            "gender", vcard_main_attributes["gender"]["description"], gender
-        )
-        email = prompt_with_temp(
-            "email", vcard_main_attributes["email"]["description"], email
-        )
-        categories = prompt_with_temp(
-            "categories", vcard_main_attributes["categories"]["description"], categories
-        )
-        bday = prompt_with_temp(
-            "bday", vcard_main_attributes["bday"]["description"], bday
-        )
-        anniversary = prompt_with_temp(
-            "anniversary",
-            vcard_main_attributes["anniversary"]["description"],
-            anniversary,
-        )
-        kind = prompt_with_temp(
-            "kind", vcard_main_attributes["kind"]["description"], kind
-        )
-        adr = prompt_with_temp("adr", vcard_main_attributes["adr"]["description"], adr)
-        tel = prompt_with_temp("tel", vcard_main_attributes["tel"]["description"], tel)
-        impp = prompt_with_temp(
-            "impp", vcard_main_attributes["impp"]["description"], impp
-        )
-        photo = prompt_with_temp(
-            "photo", vcard_main_attributes["photo"]["description"], photo
-        )
-        note = prompt_with_temp(
-            "note", vcard_main_attributes["note"]["description"], note
-        )
-        url = prompt_with_temp("url", vcard_main_attributes["url"]["description"], url)
-        source = prompt_with_temp(
-            "source", vcard_main_attributes["source"]["description"], source
-        )
-
-        # Add key
-        generate_key = typer.confirm("Do you want to create new keys?", default=False)
-
-        # Add the X-FEED attribute if the user wants to include it
-        add_feed = typer.confirm(
-            "Do you want to add a X-FEED attribute for an RSS feed?", default=False
-        )
-        if add_feed:
-            feed_url = prompt_with_temp("x_feed", "Enter the RSS feed URL", "")
-            custom_attributes["X-FEED"] = feed_url
+        # Save the entries when the prompts end, also if they are aborted or the
+        # process is terminated (e.g. the terminal is closed)
+        def exit_on_signal(signum, frame):
+            raise SystemExit(128 + signum)
+
+        termination_signals = [
+            signum
+            for signum in (signal.SIGTERM, getattr(signal, "SIGHUP", None))
+            if signum is not None
+        ]
+        previous_handlers = {
+            signum: signal.signal(signum, exit_on_signal)
+            for signum in termination_signals
+        }
+        try:
+            fn = prompt_with_temp("fn", vcard_main_attributes["fn"]["description"], fn)
+            n = prompt_with_temp("n", vcard_main_attributes["n"]["description"], n)
+            nickname = prompt_with_temp(
+                "nickname", vcard_main_attributes["nickname"]["description"], nickname
+            )
+            lang = prompt_with_temp(
+                "lang", vcard_main_attributes["lang"]["description"], lang
+            )
+            gender = prompt_with_temp(
+                "gender", vcard_main_attributes["gender"]["description"], gender
+            )
+            email = prompt_with_temp(
+                "email", vcard_main_attributes["email"]["description"], email
+            )
+            categories = prompt_with_temp(
+                "categories",
+                vcard_main_attributes["categories"]["description"],
+                categories,
+            )
+            bday = prompt_with_temp(
+                "bday", vcard_main_attributes["bday"]["description"], bday
+            )
+            anniversary = prompt_with_temp(
+                "anniversary",
+                vcard_main_attributes["anniversary"]["description"],
+                anniversary,
+            )
+            kind = prompt_with_temp(
+                "kind", vcard_main_attributes["kind"]["description"], kind
+            )
+            adr = prompt_with_temp(
+                "adr", vcard_main_attributes["adr"]["description"], adr
+            )
+            tel = prompt_with_temp(
+                "tel", vcard_main_attributes["tel"]["description"], tel
+            )
+            impp = prompt_with_temp(
+                "impp", vcard_main_attributes["impp"]["description"], impp
+            )
+            photo = prompt_with_temp(
+                "photo", vcard_main_attributes["photo"]["description"], photo
+            )
+            note = prompt_with_temp(
+                "note", vcard_main_attributes["note"]["description"], note
+            )
+            url = prompt_with_temp(
+                "url", vcard_main_attributes["url"]["description"], url
+            )
+            source = prompt_with_temp(
+                "source", vcard_main_attributes["source"]["description"], source
+            )
 
-        typer.secho(
-            "ℹ️ If you have feeds in different languages, add X-FEED;LANGUAGE:language-region to the vCard."
-        )
-        custom_feeds = []
-        add_feed = typer.confirm(
-            "Do you want to add custom X-FEED;LANGUAGE:language-region entries?",
-            default=False,
-        )
+            # Add key
+            generate_key = typer.confirm(
+                "Do you want to create new keys?", default=False
+            )
 
-        while add_feed:
-            language = prompt_with_temp(
-                f"x_feed_language_{len(custom_feeds)}",
-                "Enter the language-region (e.g., 'en-US', 'es-ES')",
-                "",
-            ).strip()
-            feed_url = prompt_with_temp(
-                f"x_feed_url_{len(custom_feeds)}", "Enter the feed URL", ""
-            ).strip()
-            custom_feeds.append((language, feed_url))
+            # Add the X-FEED attribute if the user wants to include it
             add_feed = typer.confirm(
-                "Do you want to add another X-FEED;LANGUAGE entry?", default=False
+                "Do you want to add a X-FEED attribute for an RSS feed?", default=False
             )
+            if add_feed:
+                feed_url = prompt_with_temp("x_feed", "Enter the RSS feed URL", "")
+                custom_attributes_list.append(("X-FEED", feed_url))
 
-        # Add the X-FEED;LANGUAGE entries to the vCard content
-        for language, feed_url in custom_feeds:
-            attribute_name = f"FEED;LANGUAGE={language}"
-            custom_attributes[f"X-{attribute_name}"] = feed_url
+            typer.secho(
+                "ℹ️ If you have feeds in different languages, add X-FEED;LANGUAGE:language-region to the vCard."
+            )
+            custom_feeds = []
+            add_feed = typer.confirm(
+                "Do you want to add custom X-FEED;LANGUAGE:language-region entries?",
+                default=False,
+            )
 
-        # Social links
-        add_custom_social = typer.confirm(
-            "Do you want to add custom attributes for social media links?",
-            default=False,
-        )
+            while add_feed:
+                language = prompt_with_temp(
+                    f"x_feed_language_{len(custom_feeds)}",
+                    "Enter the language-region (e.g., 'en-US', 'es-ES')",
+                    "",
+                ).strip()
+                feed_url = prompt_with_temp(
+                    f"x_feed_url_{len(custom_feeds)}", "Enter the feed URL", ""
+                ).strip()
+                custom_feeds.append((language, feed_url))
+                add_feed = typer.confirm(
+                    "Do you want to add another X-FEED;LANGUAGE entry?", default=False
+                )
 
-        # Custom attributes for social media links or other information
-        while add_custom_social:
+            # Add the X-FEED;LANGUAGE entries to the vCard content
+            for language, feed_url in custom_feeds:
+                attribute_name = f"FEED;LANGUAGE={language}"
+                custom_attributes_list.append((f"X-{attribute_name}", feed_url))
 
-            attribute_name = VCard.build_custom_attribute_social_platform(
-                typer.prompt(
-                    "Enter the name of the social platform (it will be prefixed with 'X-SOCIAL;PLATFORM=')"
-                )
-            )
-            # Prompt the user for the custom attribute value and save it to the temp file
-            attribute_value = prompt_with_temp(
-                f"x_{attribute_name}", f"Enter the value for {attribute_name}", ""
-            )
-            custom_attributes[f"{attribute_name}"] = attribute_value
+            # Social links
             add_custom_social = typer.confirm(
-                "Do you want to add another social media link?", default=False
+                "Do you want to add custom attributes for social media links?",
+                default=False,
             )
 
-        add_custom = typer.confirm(
-            "Do you want to add custom attributes for other information?",
-            default=False,
-        )
+            # Custom attributes for social media links or other information
+            while add_custom_social:
 
-        # Custom attributes for social media links or other information
-        while add_custom:
-            attribute_name = VCard.build_custom_attribute(
-                typer.prompt(
-                    "Enter the name of the custom attribute (it will be prefixed with 'X-')"
+                attribute_name = VCard.build_custom_attribute_social_platform(
+                    typer.prompt(
+                        "Enter the name of the social platform (it will be prefixed with 'X-SOCIAL;PLATFORM=')"
+                    )
                 )
-            )
-            # Prompt the user for the custom attribute value and save it to the temp file
-            attribute_value = prompt_with_temp(
-                f"x_{attribute_name}", f"Enter the value for X-{attribute_name}", ""
-            )
-            custom_attributes[f"X-{attribute_name}"] = attribute_value
+                # Prompt the user for the custom attribute value and save it to the temp file
+                attribute_value = prompt_with_temp(
+                    f"x_{attribute_name}", f"Enter the value for {attribute_name}", ""
+                )
+                custom_attributes_list.append((f"{attribute_name}", attribute_value))
+                add_custom_social = typer.confirm(
+                    "Do you want to add another social media link?", default=False
+                )
+
             add_custom = typer.confirm(
-                "Do you want to add another custom attribute?", default=False
+                "Do you want to add custom attributes for other information?",
+                default=False,
             )
 
+            # Custom attributes for social media links or other information
+            while add_custom:
+                attribute_name = VCard.build_custom_attribute(
+                    typer.prompt(
+                        "Enter the name of the custom attribute (it will be prefixed with 'X-')"
+                    )
+                )
+                # Prompt the user for the custom attribute value and save it to the temp file
+                attribute_value = prompt_with_temp(
+                    f"x_{attribute_name}", f"Enter the value for X-{attribute_name}", ""
+                )
+                custom_attributes_list.append((f"X-{attribute_name}", attribute_value))
+                add_custom = typer.confirm(
+                    "Do you want to add another custom attribute?", default=False
+                )
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            save_temp()
+
+    custom_attributes = dict(custom_attributes_list)
+
     keys = None
     if generate_key:
+        from ..shared.security import action_generate_keypair
+
         priv, pub, key = action_generate_keypair(
             Path("vcard_private.pem"), Path("vcard_public.pem")
         )
@@ -291,10 +319,9 @@ def create(
         keys,
     )
 
-    # Print a summary of the vCard
-    typer.secho("\nSummary of the vCard:", fg=typer.colors.CYAN)
-    typer.echo(vcard_content)
-    typer.echo("\n")
+    # Print a summary of the vCard in a single write
+    summary_title = typer.style("\nSummary of the vCard:", fg=typer.colors.CYAN)
+    typer.echo(f"{summary_title}\n{vcard_content}\n\n")
 
     # Ask for confirmation before saving
     if interactive:
@@ -351,6 +378,9 @@ def fetch(
     Supports multiple files, directories, URLs, dry-run mode, backups, colored diffs,
     a progress bar, and a final summary report.
     """
+    import difflib
+    from rich.progress import Progress
+    from rich.syntax import Syntax
 
     vcard_inputs = VCardInputs(inputs)
     total_inputs = len(vcard_inputs.vcard_files) + len(vcard_inputs.vcard_urls)
@@ -529,6 +559,7 @@ def endorse(
     Parse each vCard, extract its preferred key, build canonical endorsement string,
     and sign it.
     """
+    from ..shared.security import load_private_key_pem
 
     valid_confidence_levels = {"low", "medium", "high"}
     if confidence not in valid_confidence_levels:
@@ -625,9 +656,10 @@ def qr(
 
     data = None
     if input:
-        if os.path.isfile(input):
-            with open(input, "r", encoding="utf-8") as file:
-                data = file.read().strip()
+        try:
+            data = Path(input).read_text(encoding="utf-8").strip()
+        except OSError:
+            data = None
     elif not os.isatty(0):  # Check if stdin is not a terminal
         data = sys.stdin.read().strip()
 
@@ -662,8 +694,12 @@ def qr(
             )
             raise typer.Exit()
 
+    from ..shared.qr import generate_qr
+
     generate_qr(image, output, data, caption_top, caption_bottom)
 
+    typer.secho(f"✅ QR code generated and saved to {output}", fg=typer.colors.GREEN)
+
 
 if __name__ == "__main__":
     app()
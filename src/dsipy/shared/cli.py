@@ -1,6 +1,5 @@
 from functools import wraps
 import typer
-import traceback
 import logging
 
 
@@ -1,7 +1,37 @@
 import typer
 import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
+
+
+def iter_files(
+    directory: Path, suffixes: tuple[str, ...] | None = None
+) -> Iterator[Path]:
+    """
+    Recursively yield the files of a directory using os.scandir, which reuses the
+    file type information of the directory listing instead of calling stat per entry.
+    Symbolic links to directories are not followed, and directories that cannot be
+    listed (including a missing directory) are skipped, as os.walk does.
+    Args:
+        directory (Path): Directory to traverse.
+        suffixes (tuple[str, ...] | None): Only yield files whose name ends with one of these suffixes.
+    Yields:
+        Path: Path of each matching file.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and (
+                    suffixes is None or entry.name.endswith(suffixes)
+                ):
+                    yield Path(entry.path)
 
 
 def get_local_files_from_inputs(inputs: List[Path], filter_func) -> List[Path]:
@@ -19,9 +49,5 @@ def get_local_files_from_inputs(inputs: List[Path], filter_func) -> List[Path]:
         if input_path.is_file() and filter_func(input_path):
             files.append(input_path)
         if input_path.is_dir():
-            for root, _, dir_files in os.walk(input_path):
-                for f in dir_files:
-                    filepath = Path(root) / f
-                    if filter_func(filepath):
-                        files.append(filepath)
+            files.extend(f for f in iter_files(input_path) if filter_func(f))
     return files
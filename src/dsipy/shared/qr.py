@@ -125,5 +125,3 @@ def generate_qr(
         QRimg.save(output)
     else:
         QRimg.show()
-
-    print("QR code generated!")
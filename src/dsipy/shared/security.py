@@ -1,4 +1,6 @@
 import base64
+import functools
+from collections.abc import Iterable
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 from pathlib import Path
@@ -30,11 +32,7 @@ def generate_keypair() -> tuple[bytes, bytes, str]:
     )
 
     # DER → base64 (for vCard)
-    public_der = public_key.public_bytes(
-        encoding=serialization.Encoding.DER,
-        format=serialization.PublicFormat.SubjectPublicKeyInfo,
-    )
-    public_b64 = base64.b64encode(public_der).decode("ascii")
+    public_b64 = public_key_to_b64der(public_key)
 
     return private_pem, public_pem, public_b64
 
@@ -79,7 +77,7 @@ def public_key_to_der(public_key) -> bytes:
     )
 
 
-def public_key_to_b64der(public_key) -> bytes:
+def public_key_to_b64der(public_key) -> str:
     """
     Export a public key to DER format and then encode it in Base64.
     Args:
@@ -87,12 +85,7 @@ def public_key_to_b64der(public_key) -> bytes:
     Returns:
         str: The public key in Base64-encoded DER format.
     """
-    return base64.b64encode(
-        public_key.public_bytes(
-            encoding=serialization.Encoding.DER,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-    ).decode("utf-8")
+    return base64.b64encode(public_key_to_der(public_key)).decode("ascii")
 
 
 def b64der_to_public_key(content: str) -> str:
@@ -130,9 +123,10 @@ def load_private_key_pem(pem_bytes: bytes) -> bytes:
     return serialization.load_pem_private_key(pem_bytes, password=None)
 
 
+@functools.lru_cache(maxsize=1024)
 def load_public_key_pem(pem_bytes: bytes) -> bytes:
     """
-    Load a public key from PEM bytes.
+    Load a public key from PEM bytes. The result is cached.
     Args:
         pem_bytes (bytes): The PEM-encoded public key bytes.
     Returns:
@@ -141,9 +135,11 @@ def load_public_key_pem(pem_bytes: bytes) -> bytes:
     return serialization.load_pem_public_key(pem_bytes)
 
 
+@functools.lru_cache(maxsize=1024)
 def load_public_key_b64_der(b64: str) -> bytes:
     """
-    Load a public key from a Base64-encoded DER string.
+    Load a public key from a Base64-encoded DER string. The result is cached, as
+    the same key is usually loaded once per signature made with it.
     Args:
         b64 (str): The Base64-encoded DER string of the public key.
     Returns:
@@ -175,17 +171,52 @@ def sign_endorsement(private_key, endorsee_key_b64: str) -> str:
     return sig.hex()
 
 
+def _public_key(public_key):
+    """Return the public key object, loading it if given as a Base64 DER string."""
+    if isinstance(public_key, str):
+        return load_public_key_b64_der(public_key)
+    return public_key
+
+
+def _signature_bytes(signature: str | bytes) -> bytes:
+    """Return the signature as bytes, decoding it if given in hexadecimal format."""
+    return bytes.fromhex(signature) if isinstance(signature, str) else signature
+
+
 def verify_endorsement_signature(
-    public_key, endorsee_key_b64: str, signature_hex: str
+    public_key, endorsee_key_b64: str, signature_hex: str | bytes
 ) -> bool:
+    """
+    Verifies an endorsement signature (hexadecimal or already decoded bytes).
+    The public key can be given as a key object or a Base64-encoded DER string.
+    """
     canonical = canonical_endorsement_string(endorsee_key_b64)
     try:
-        public_key.verify(bytes.fromhex(signature_hex), canonical)
+        _public_key(public_key).verify(_signature_bytes(signature_hex), canonical)
         return True
     except Exception:
         return False
 
 
+def verify_endorsements_batch(
+    public_key, endorsements: Iterable[tuple[str, str | bytes]]
+) -> list[bool]:
+    """
+    Verifies several endorsements made by the same endorser.
+    Args:
+        public_key: The public key object or its Base64-encoded DER string.
+        endorsements: Pairs of (endorsee_key_b64, signature) to verify.
+    Returns:
+        list[bool]: The verification result of each endorsement, in order.
+    """
+    public_key = _public_key(public_key)
+
+    return [
+        verify_endorsement_signature(public_key, endorsee_key_b64, signature)
+        for endorsee_key_b64, signature in endorsements
+    ]
+
+
 # ============================================================
 # Feed signing (RSS items)
 # ============================================================
@@ -211,12 +242,19 @@ def sign_feed_item(
 
 
 def verify_feed_signature(
-    public_key, pub_date: str, title: str, description_plain: str, signature_hex: str
+    public_key,
+    pub_date: str,
+    title: str,
+    description_plain: str,
+    signature_hex: str | bytes,
 ) -> bool:
-    """Verifies a feed item signature."""
+    """
+    Verifies a feed item signature (hexadecimal or already decoded bytes).
+    The public key can be given as a key object or a Base64-encoded DER string.
+    """
     canonical = canonical_feed_string(pub_date, title, description_plain)
     try:
-        public_key.verify(bytes.fromhex(signature_hex), canonical)
+        _public_key(public_key).verify(_signature_bytes(signature_hex), canonical)
         return True
     except Exception:
         return False
@@ -1,19 +1,15 @@
 import unicodedata
 import re
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
-def slugify(text):
-    # Normalize accents (á → a, ñ → n, ü → u)
-    normalized = unicodedata.normalize("NFKD", text)
-    ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-
-    # Lowercase
-    ascii_text = ascii_text.lower()
-
-    # Replace any non‑alphanumeric group with a single hyphen
-    ascii_text = re.sub(r"[^a-z0-9]+", "-", ascii_text)
 
-    # Remove leading/trailing hyphens
-    ascii_text = ascii_text.strip("-")
-
-    return ascii_text
+def slugify(text):
+    # Normalize accents (á → a, ñ → n, ü → u). Pure ASCII input needs no folding.
+    if not text.isascii():
+        normalized = unicodedata.normalize("NFKD", text)
+        text = normalized.encode("ascii", "ignore").decode("ascii")
+
+    # Lowercase, replace any non‑alphanumeric group with a single hyphen and
+    # remove leading/trailing hyphens
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
@@ -1,12 +1,9 @@
 from dataclasses import dataclass, field, asdict
+import functools
 import json
-from opyml import OPML, Outline
 from pathlib import Path
 import re
-import requests
-from typing import List, Optional
-import vobject
-from .security import canonical_endorsement_string, sign_endorsement
+from typing import Iterable, Iterator, List, Optional
 from .file import get_local_files_from_inputs
 
 allowed_vcard_extensions = [".vcf", ".vcard"]
@@ -106,6 +103,27 @@ vcard_main_attributes = {
     },
 }
 
+# Line format of the main attributes, in the order they are written in a new vCard
+vcard_content_lines = (
+    ("fn", "FN:{}"),
+    ("n", "N:{};;;;"),
+    ("nickname", "NICKNAME:{}"),
+    ("lang", "LANG:{}"),
+    ("gender", "GENDER:{}"),
+    ("email", "EMAIL:{}"),
+    ("categories", "CATEGORIES:{}"),
+    ("bday", "BDAY:{}"),
+    ("anniversary", "ANNIVERSARY:{}"),
+    ("kind", "KIND:{}"),
+    ("adr", "ADR:{}"),
+    ("tel", "TEL:{}"),
+    ("impp", "IMPP:{}"),
+    ("photo", "PHOTO:{}"),
+    ("note", "NOTE;LANGUAGE=en-US:{}"),
+    ("url", "URL:{}"),
+    ("source", "SOURCE:{}"),
+)
+
 
 @dataclass
 class Profile:
@@ -139,20 +157,28 @@ class Profile:
 # -----------------------------
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_params_items(header: str) -> tuple[tuple[str, str], ...]:
+    """Cached parse of the parameters of a header, as (name, value) pairs."""
+    params = {}
+    parts = header.split(";")[1:]  # skip property name
+    for p in parts:
+        if "=" in p:
+            k, v = p.split("=", 1)
+            params[k.upper()] = v
+    return tuple(params.items())
+
+
 def parse_params(header: str) -> dict:
     """
     Extracts parameters from a vCard property header.
+    Headers repeat often across vCards (e.g. KEY;TYPE=public;ALG=ed25519;PREF=1;ENCODING=b),
+    so the parsing is cached and a new dict is returned on each call.
     Example:
         'X-ENDORSE;ENCODING=b;SIG=abcd;DATE=2026...' ->
         {'ENCODING': 'b', 'SIG': 'abcd', 'DATE': '2026...'}
     """
-    params = {}
-    parts = header.split(";")[1:]  # skip property name
-    for p in parts:
-        if "=" in p:
-            k, v = p.split("=", 1)
-            params[k.upper()] = v
-    return params
+    return dict(_parse_params_items(header))
 
 
 # -----------------------------
@@ -228,6 +254,8 @@ class VCard:
     @staticmethod
     def sign_endorsement(private_key, endorsee_key_b64: str) -> str:
         """Return the endorsement signature in hexadecimal format."""
+        from .security import canonical_endorsement_string, sign_endorsement
+
         return sign_endorsement(
             private_key, canonical_endorsement_string(endorsee_key_b64)
         )
@@ -252,6 +280,8 @@ class VCard:
         Raises:
             requests.RequestException: If the URL fetch fails.
         """
+        import requests
+
         response = requests.get(url, timeout=10)
         response.raise_for_status()
         response.encoding = "utf-8"
@@ -269,6 +299,7 @@ class VCard:
         return text, filename
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def build_custom_attribute_social_platform(name):
         """
         Build a custom attribute string for the vCard.
@@ -282,6 +313,7 @@ class VCard:
         return f"X-SOCIAL;PLATFORM={name.strip().lower()}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def build_custom_attribute(name):
         """
         Build a custom attribute string for the vCard.
@@ -372,60 +404,118 @@ class VCard:
             custom_attributes = {}
 
         # Start building the vCard content
-        vcard_content = "BEGIN:VCARD\nVERSION:4.0\n"
+        lines = ["BEGIN:VCARD", "VERSION:4.0"]
+
+        values = {
+            "fn": fn,
+            "n": n,
+            "nickname": nickname,
+            "lang": lang,
+            "gender": gender,
+            "email": email,
+            "categories": categories,
+            "bday": bday,
+            "anniversary": anniversary,
+            "kind": kind,
+            "adr": adr,
+            "tel": tel,
+            "impp": impp,
+            "photo": photo,
+            "note": note,
+            "url": url,
+            "source": source,
+        }
 
         # Add optional fields conditionally
-        if fn:
-            vcard_content += f"FN:{fn}\n"
-        if n:
-            vcard_content += f"N:{n};;;;\n"
-        if nickname:
-            vcard_content += f"NICKNAME:{nickname}\n"
-        if lang:
-            vcard_content += f"LANG:{lang}\n"
-        if gender:
-            vcard_content += f"GENDER:{gender}\n"
-        if email:
-            vcard_content += f"EMAIL:{email}\n"
-        if categories:
-            vcard_content += f"CATEGORIES:{categories}\n"
-        if bday:
-            vcard_content += f"BDAY:{bday}\n"
-        if anniversary:
-            vcard_content += f"ANNIVERSARY:{anniversary}\n"
-        if kind:
-            vcard_content += f"KIND:{kind}\n"
-        if adr:
-            vcard_content += f"ADR:{adr}\n"
-        if tel:
-            vcard_content += f"TEL:{tel}\n"
-        if impp:
-            vcard_content += f"IMPP:{impp}\n"
-        if photo:
-            vcard_content += f"PHOTO:{photo}\n"
-        if note:
-            vcard_content += f"NOTE;LANGUAGE=en-US:{note}\n"
-        if url:
-            vcard_content += f"URL:{url}\n"
-        if source:
-            vcard_content += f"SOURCE:{source}\n"
+        for attribute_name, line_format in vcard_content_lines:
+            value = values[attribute_name]
+            if value:
+                lines.append(line_format.format(value))
         if keys:
             for key in keys:
-                vcard_content += f"KEY;TYPE=public;ALG={key['alg'].lower()};PREF={key.get('pref', 1)};ENCODING={key['encoding']}:{key['key_b64']}\n"
+                header = (
+                    f"KEY;TYPE=public;ALG={key['alg'].lower()};"
+                    f"PREF={key.get('pref', 1)};ENCODING={key['encoding']}"
+                )
+                lines.append(f"{header}:{key['key_b64']}")
 
         # Add custom attributes conditionally
         for attribute_name, attribute_value in custom_attributes.items():
-            vcard_content += f"{attribute_name}:{attribute_value}\n"
+            lines.append(f"{attribute_name}:{attribute_value}")
 
         # End the vCard content
-        vcard_content += "END:VCARD"
+        lines.append("END:VCARD")
+
+        return "\n".join(lines)
+
+
+# -------------------------
+# Properties with parameters
+# -------------------------
+
+
+def add_public_key(profile: Profile, value: str, attributes: dict):
+    profile.keys.append(
+        PublicKey(
+            alg=attributes.get("ALG", "").lower(),
+            key_b64=value,
+            pref=int(attributes["PREF"]) if "PREF" in attributes else None,
+        )
+    )
+
+
+def add_revoked_key(profile: Profile, value: str, attributes: dict):
+    profile.revocations.append(
+        RevokedKey(
+            key_b64=value,
+            reason=attributes.get("REASON"),
+            date=attributes.get("DATE"),
+        )
+    )
+
+
+def add_endorsement(profile: Profile, value: str, attributes: dict):
+    # Endorsements (single-line format)
+    profile.endorsements.append(
+        Endorsement(
+            endorsee_key_b64=value,
+            signature_hex=attributes.get("SIG", ""),
+            date=attributes.get("DATE"),
+            confidence=attributes.get("CONFIDENCE"),
+        )
+    )
+
+
+def add_feed(profile: Profile, value: str, attributes: dict):
+    # Feeds (single-line format)
+    profile.feeds.append(
+        Feed(
+            language=attributes.get("LANGUAGE", ""),
+            category=attributes.get("CATEGORY", ""),
+            url=value,
+        )
+    )
+
+
+# Handlers of the properties with parameters (e.g. KEY;ALG=ed25519:...), by property name
+vcard_param_properties = {
+    "KEY": add_public_key,
+    "REVKEY": add_revoked_key,
+    "X-ENDORSE": add_endorsement,
+    "X-FEED": add_feed,
+}
+
+property_name_pattern = re.compile(r"^[^:;]+")
 
-        return vcard_content
+# Names of the properties parse_vcard extracts, to skip any other line at once
+vcard_parsed_properties = frozenset(
+    [*vcard_param_properties, *(name.upper() for name in vcard_main_attributes)]
+)
 
 
 def parse_vcard(text: str) -> Profile:
     profile = Profile(raw=text)
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    lines = [line for line in map(str.strip, text.splitlines()) if line]
 
     for line in lines:
 
@@ -433,75 +523,21 @@ def parse_vcard(text: str) -> Profile:
         value = None
         attributes = {}
 
-        match = re.match(r"^[^:;]+", line)
-
-        # -------------------------
-        # Public keys
-        # -------------------------
-        if line.startswith("KEY;"):
-            attr_name = "key"
-            header, value = line.split(":", 1)
-            attributes = parse_params(header)
-            profile.keys.append(
-                PublicKey(
-                    alg=attributes.get("ALG", "").lower(),
-                    key_b64=value,
-                    pref=int(attributes["PREF"]) if "PREF" in attributes else None,
-                )
-            )
+        match = property_name_pattern.match(line)
 
-        # -------------------------
-        # Revoked keys
-        # -------------------------
-        elif line.startswith("REVKEY;"):
-            attr_name = "revkey"
-            header, value = line.split(":", 1)
-            attributes = parse_params(header)
-            profile.revocations.append(
-                RevokedKey(
-                    key_b64=value,
-                    reason=attributes.get("REASON"),
-                    date=attributes.get("DATE"),
-                )
-            )
+        if match and match.group(0).upper() in vcard_parsed_properties:
+            name = match.group(0)
+            add_property = vcard_param_properties.get(name)
 
-        # -------------------------
-        # Endorsements (single-line format)
-        # -------------------------
-        elif line.startswith("X-ENDORSE;"):
-            attr_name = "x-endorse"
-            header, value = line.split(":", 1)
-            attributes = parse_params(header)
-            profile.endorsements.append(
-                Endorsement(
-                    endorsee_key_b64=value,
-                    signature_hex=attributes.get("SIG", ""),
-                    date=attributes.get("DATE"),
-                    confidence=attributes.get("CONFIDENCE"),
-                )
-            )
-
-        # -------------------------
-        # Feeds (single-line format)
-        # -------------------------
-        elif line.startswith("X-FEED;"):
-            attr_name = "x-feed"
-            header, value = line.split(":", 1)
-            attributes = parse_params(header)
-
-            profile.feeds.append(
-                Feed(
-                    language=attributes.get("LANGUAGE", ""),
-                    category=attributes.get("CATEGORY", ""),
-                    url=value,
-                )
-            )
-        elif match:
-            attr_name_matched = match.group(0).lower()
-            if attr_name_matched in vcard_main_attributes:
-                attr_name = attr_name_matched
-                value = line[len(attr_name_matched) + 1 :]
-                setattr(profile, attr_name_matched, value)
+            if add_property and line.startswith(";", len(name)):
+                attr_name = name.lower()
+                header, value = line.split(":", 1)
+                attributes = parse_params(header)
+                add_property(profile, value, attributes)
+            elif name.lower() in vcard_main_attributes:
+                attr_name = name.lower()
+                value = line[len(name) + 1 :]
+                setattr(profile, attr_name, value)
 
         profile.raw_lines.append(
             {
@@ -525,7 +561,7 @@ def build_vcard_from_raw_lines(profile: Profile) -> str:
     Returns:
         str: The reconstructed vCard content.
     """
-    vcard_content = "BEGIN:VCARD\nVERSION:4.0\n"
+    lines = ["BEGIN:VCARD", "VERSION:4.0"]
 
     for raw_line in profile.raw_lines:
         line = raw_line.get("line", "")
@@ -535,36 +571,141 @@ def build_vcard_from_raw_lines(profile: Profile) -> str:
             and not line.startswith("END:")
             and not line.startswith("VERSION:")
         ):
-            vcard_content += f"{line}\n"
+            lines.append(line)
 
-    vcard_content += "END:VCARD"
-    return vcard_content
+    lines.append("END:VCARD")
+    return "\n".join(lines)
 
 
-def generate_opml_from_vcards(vcard_files: List[Path]) -> str:
+vcard_escaped_value_pattern = re.compile(r"\\([\\,;nN])")
+
+
+def unescape_vcard_value(value: str) -> str:
     """
-    Reads vCard files and generates an OPML file.
+    Unescape a vCard text value (\\, \\; \\\\ and \\n).
+
+    Args:
+        value (str): The escaped value.
+
+    Returns:
+        str: The unescaped value.
+    """
+    return vcard_escaped_value_pattern.sub(
+        lambda match: "\n" if match.group(1) in "nN" else match.group(1), value
+    )
+
+
+def unfold_vcard_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Join the folded vCard lines, whose continuation lines start with a space or
+    a tab, and yield the stripped logical lines.
+
+    Args:
+        lines (Iterable[str]): The physical lines, e.g. an open vCard file.
+
+    Returns:
+        Iterator[str]: The unfolded lines.
+    """
+    current = None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current.strip()
+        current = line
+
+    if current is not None:
+        yield current.strip()
+
+
+def iter_vcard_feeds(vcard_file: Path) -> Iterator[tuple[str, str]]:
+    """
+    Scan a vCard file line by line and yield the name and feed URL of each vCard
+    that has a feed. Only the first FN and X-FEED properties of a vCard are used.
+
+    Args:
+        vcard_file (Path): Path to the vCard file, that can contain several vCards.
+
+    Returns:
+        Iterator[tuple[str, str]]: The (name, feed_url) pairs. The name is
+        "Unknown" if the vCard has no FN property.
+    """
+    # TODO: unify the parse of vCard files with the VCard class
+    name = feed_url = None
+
+    with vcard_file.open(encoding="utf-8") as f:
+        for line in unfold_vcard_lines(f):
+            if line.upper() == "END:VCARD":
+                if feed_url:
+                    yield "Unknown" if name is None else name, feed_url
+                name = feed_url = None
+                continue
+
+            match = property_name_pattern.match(line)
+            if not match or ":" not in line:
+                continue
+
+            property_name = match.group(0).upper()
+            if property_name == "FN" and name is None:
+                name = unescape_vcard_value(line.split(":", 1)[1])
+            elif property_name == "X-FEED" and feed_url is None:
+                feed_url = unescape_vcard_value(line.split(":", 1)[1])
+
+
+def build_opml_outline(name: str, feed_url: str) -> str:
+    """
+    Build the OPML outline element of a feed.
+
+    Args:
+        name (str): The name of the feed owner, used as text and title.
+        feed_url (str): The URL of the feed.
+
+    Returns:
+        str: The outline element.
+    """
+    from xml.sax.saxutils import escape
+
+    name = escape(name, {'"': "&quot;"})
+    feed_url = escape(feed_url, {'"': "&quot;"})
+    return f'<outline text="{name}" xmlUrl="{feed_url}" title="{name}" />'
+
+
+def iter_opml_from_vcards(vcard_files: List[Path]) -> Iterator[str]:
+    """
+    Reads vCard files and yields the OPML document in fragments, one outline per
+    vCard with a feed URL, so the document is never held in memory as a whole.
 
     Args:
         vcard_files (List[Path]): List of paths to vCard files.
+
+    Raises:
+        ValueError: If none of the vCards has a feed URL.
     """
-    opml = OPML()
+    has_outlines = False
 
     for vcard_file in vcard_files:
-        text = vcard_file.read_text(encoding="utf-8")
-        # TODO: unify the parse of vCard files with the VCard class
-        for vcard in vobject.readComponents(text):
-            # Extract the name and feed URL from the vCard
-            name = vcard.fn.value if hasattr(vcard, "fn") else "Unknown"
-            feed_url = vcard.x_feed.value if hasattr(vcard, "x_feed") else None
-
-            if feed_url:
-                opml.body.outlines.append(
-                    Outline(text=name, title=name, xml_url=feed_url)
-                )
-    if len(opml.body.outlines) == 0:
+        for name, feed_url in iter_vcard_feeds(vcard_file):
+            if not has_outlines:
+                has_outlines = True
+                yield '<opml version="2.0"><body>'
+            yield build_opml_outline(name, feed_url)
+
+    if not has_outlines:
         raise ValueError("No valid vCards with feed URLs found in the provided files.")
-    return opml.to_xml()
+    yield "</body></opml>"
+
+
+def generate_opml_from_vcards(vcard_files: List[Path]) -> str:
+    """
+    Reads vCard files and generates an OPML file.
+
+    Args:
+        vcard_files (List[Path]): List of paths to vCard files.
+    """
+    return "".join(iter_opml_from_vcards(vcard_files))
 
 
 def fetch_vcard_from_url(url):
@@ -580,6 +721,8 @@ def fetch_vcard_from_url(url):
     Raises:
         requests.RequestException: If the URL fetch fails.
     """
+    import requests
+
     response = requests.get(url, timeout=10)
     response.raise_for_status()
     response.encoding = "utf-8"
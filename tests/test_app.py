@@ -0,0 +1,59 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.dsipy.app import main_app
+
+
+class TestMainApp(unittest.TestCase):
+    def run_main_app(self, args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                main_app(args)
+            except SystemExit as e:
+                exit_code = e.code
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_prints_commands_without_arguments(self):
+        for args in ([], ["--help"]):
+            exit_code, stdout, _ = self.run_main_app(args)
+
+            self.assertEqual(exit_code, 0)
+            for command in ("vcard", "feeds", "connections", "key"):
+                self.assertIn(command, stdout)
+
+    def test_unknown_command_exits_with_code_2(self):
+        exit_code, _, stderr = self.run_main_app(["unknown"])
+
+        self.assertEqual(exit_code, 2)
+        self.assertIn("No such command 'unknown'", stderr)
+
+    def test_subcommand_help_uses_the_command_description(self):
+        exit_code, stdout, _ = self.run_main_app(["key", "--help"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Commands related to keys", stdout)
+
+    def test_routes_single_command_app_through_the_group(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "alice.vcf"
+            vcard_path.write_text(
+                "BEGIN:VCARD\nVERSION:4.0\nFN:Alice Example\n"
+                "X-FEED:https://example.com/feed.xml\nEND:VCARD\n",
+                encoding="utf-8",
+            )
+
+            exit_code, stdout, _ = self.run_main_app(
+                ["connections", "feed", str(vcard_path)]
+            )
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn('xmlUrl="https://example.com/feed.xml"', stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+from typer.main import get_group
+
+from src.dsipy.apps.connections import app as connections
+
+VCARD = """BEGIN:VCARD
+VERSION:4.0
+FN:Alice Example
+X-FEED:https://example.com/feed.xml
+END:VCARD
+"""
+
+
+class TestConnectionsFeedCommand(unittest.TestCase):
+    def setUp(self):
+        self.runner = CliRunner()
+        # Run the app as a group, as the main app does
+        self.app = get_group(connections.app)
+
+    def test_writes_opml_to_output(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "alice.vcf"
+            vcard_path.write_text(VCARD, encoding="utf-8")
+            output = Path(tmp_dir) / "out" / "feeds.opml"
+
+            result = self.runner.invoke(
+                self.app, ["feed", str(vcard_path), "-o", str(output)]
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertNotIn("Input path does not exist", result.output)
+            self.assertIn(
+                'xmlUrl="https://example.com/feed.xml"',
+                output.read_text(encoding="utf-8"),
+            )
+            self.assertEqual(list(output.parent.iterdir()), [output])
+
+    def test_keeps_unrelated_tmp_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "alice.vcf"
+            vcard_path.write_text(VCARD, encoding="utf-8")
+            output = Path(tmp_dir) / "feeds.opml"
+            user_file = Path(tmp_dir) / "feeds.tmp"
+            user_file.write_text("user data", encoding="utf-8")
+
+            result = self.runner.invoke(
+                self.app, ["feed", str(vcard_path), "-o", str(output)]
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(user_file.read_text(encoding="utf-8"), "user data")
+            self.assertIn("<opml", output.read_text(encoding="utf-8"))
+
+    def test_writes_output_with_tmp_suffix(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "alice.vcf"
+            vcard_path.write_text(VCARD, encoding="utf-8")
+            output = Path(tmp_dir) / "out" / "list.tmp"
+
+            result = self.runner.invoke(
+                self.app, ["feed", str(vcard_path), "-o", str(output)]
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertIn("<opml", output.read_text(encoding="utf-8"))
+            self.assertEqual(list(output.parent.iterdir()), [output])
+
+    def test_output_has_the_default_file_mode(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "alice.vcf"
+            vcard_path.write_text(VCARD, encoding="utf-8")
+            output = Path(tmp_dir) / "feeds.opml"
+            reference = Path(tmp_dir) / "reference.txt"
+            reference.write_text("", encoding="utf-8")
+
+            self.runner.invoke(self.app, ["feed", str(vcard_path), "-o", str(output)])
+
+            self.assertEqual(
+                os.stat(output).st_mode & 0o777, os.stat(reference).st_mode & 0o777
+            )
+
+    def test_keeps_output_when_a_vcard_cannot_be_read(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "alice.vcf"
+            vcard_path.write_text(VCARD, encoding="utf-8")
+            invalid_path = Path(tmp_dir) / "invalid.vcf"
+            invalid_path.write_bytes(b"BEGIN:VCARD\nFN:\xff\nEND:VCARD\n")
+            output = Path(tmp_dir) / "out" / "feeds.opml"
+            output.parent.mkdir()
+            output.write_text("previous", encoding="utf-8")
+
+            result = self.runner.invoke(
+                self.app,
+                ["feed", str(vcard_path), str(invalid_path), "-o", str(output)],
+            )
+
+            self.assertNotIn("Input path does not exist", result.output)
+            self.assertIn("failed", result.output)
+            self.assertEqual(output.read_text(encoding="utf-8"), "previous")
+            self.assertEqual(list(output.parent.iterdir()), [output])
+
+
+if __name__ == "__main__":
+    unittest.main()
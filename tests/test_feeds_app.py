@@ -0,0 +1,77 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from src.dsipy.apps.feeds import app as feeds
+
+
+class TestFeedsBuildCommand(unittest.TestCase):
+    def setUp(self):
+        self.runner = CliRunner()
+
+    def build(self, *options):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            states_dir = Path(tmp_dir) / "states"
+            states_dir.mkdir()
+            (states_dir / "hello.md").write_text(
+                "---\ntitle: Hello\ndate: 2025-01-01\n---\nHello world\n",
+                encoding="utf-8",
+            )
+            output = Path(tmp_dir) / "feed.rss"
+
+            with patch(
+                "src.dsipy.apps.feeds.lib.markdown.CACHE_FILE",
+                Path(tmp_dir) / "cache" / "parsed.json",
+            ):
+                result = self.runner.invoke(
+                    feeds.app, ["build", str(states_dir), "-o", str(output), *options]
+                )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            return output.read_text(encoding="utf-8")
+
+    def test_options_take_precedence_over_prompts(self):
+        with patch("src.dsipy.apps.feeds.app.typer.prompt") as mock_prompt:
+            rss = self.build(
+                "-t",
+                "My Title",
+                "-k",
+                "https://example.org",
+                "-d",
+                "My Description",
+                "-a",
+                "Alice",
+                "-e",
+                "alice@example.org",
+            )
+
+        mock_prompt.assert_not_called()
+        self.assertIn("<title>My Title</title>", rss)
+        self.assertIn("<link>https://example.org</link>", rss)
+        self.assertIn("<description>My Description</description>", rss)
+        self.assertIn("<author>Alice (alice@example.org)</author>", rss)
+
+    def test_prompts_once_for_each_missing_option(self):
+        with patch(
+            "src.dsipy.apps.feeds.app.typer.prompt", return_value="Prompted Author"
+        ) as mock_prompt:
+            rss = self.build(
+                "-t",
+                "My Title",
+                "-k",
+                "https://example.org",
+                "-d",
+                "My Description",
+                "-e",
+                "alice@example.org",
+            )
+
+        mock_prompt.assert_called_once()
+        self.assertIn("<author>Prompted Author (alice@example.org)</author>", rss)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.dsipy.shared.file import iter_files
+
+
+class TestIterFiles(unittest.TestCase):
+    def test_yields_nested_files_with_suffix(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "sub").mkdir()
+            (root / "a.md").write_text("a", encoding="utf-8")
+            (root / "sub" / "b.md").write_text("b", encoding="utf-8")
+            (root / "sub" / "c.txt").write_text("c", encoding="utf-8")
+
+            files = sorted(iter_files(root, (".md",)))
+
+            self.assertEqual(files, [root / "a.md", root / "sub" / "b.md"])
+
+    def test_missing_directory_yields_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.assertEqual(list(iter_files(Path(tmp_dir) / "missing")), [])
+
+    def test_skips_directories_that_cannot_be_listed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "private").mkdir()
+            (root / "private" / "b.md").write_text("b", encoding="utf-8")
+            (root / "a.md").write_text("a", encoding="utf-8")
+            scandir = os.scandir
+
+            def failing_scandir(path):
+                if Path(path).name == "private":
+                    raise PermissionError(13, "Permission denied", path)
+                return scandir(path)
+
+            with patch("src.dsipy.shared.file.os.scandir", failing_scandir):
+                files = list(iter_files(root))
+
+            self.assertEqual(files, [root / "a.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
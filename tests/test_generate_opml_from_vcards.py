@@ -70,6 +70,72 @@ END:VCARD
         self.assertIn("https://example.com/feed1.xml", opml_xml)
         self.assertIn("https://example.com/feed2.xml", opml_xml)
 
+    def test_generates_opml_from_vcards_in_the_same_file(self):
+        vcard_content = """BEGIN:VCARD
+VERSION:4.0
+FN:Alice Example
+X-FEED;TYPE=rss:https://example.com/feed1.xml
+END:VCARD
+BEGIN:VCARD
+VERSION:4.0
+FN:Bob Example
+END:VCARD
+BEGIN:VCARD
+VERSION:4.0
+x-feed:https://example.com/feed3.xml
+END:VCARD
+"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "contacts.vcf"
+            vcard_path.write_text(vcard_content, encoding="utf-8")
+
+            opml_xml = generate_opml_from_vcards([vcard_path])
+
+        self.assertIn(
+            '<outline text="Alice Example" xmlUrl="https://example.com/feed1.xml"',
+            opml_xml,
+        )
+        self.assertNotIn("Bob Example", opml_xml)
+        self.assertIn(
+            '<outline text="Unknown" xmlUrl="https://example.com/feed3.xml"',
+            opml_xml,
+        )
+
+    def test_unfolds_folded_feed_url(self):
+        vcard_content = (
+            "BEGIN:VCARD\r\n"
+            "VERSION:4.0\r\n"
+            "FN:Alice Example\r\n"
+            "X-FEED:https://example.com/feed.x\r\n"
+            " ml\r\n"
+            "END:VCARD\r\n"
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "alice.vcf"
+            vcard_path.write_bytes(vcard_content.encode("utf-8"))
+
+            opml_xml = generate_opml_from_vcards([vcard_path])
+
+        self.assertIn('xmlUrl="https://example.com/feed.xml"', opml_xml)
+
+    def test_unescapes_name(self):
+        vcard_content = """BEGIN:VCARD
+VERSION:4.0
+FN:Doe\\, John
+X-FEED:https://example.com/feed.xml
+END:VCARD
+"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vcard_path = Path(tmp_dir) / "john.vcf"
+            vcard_path.write_text(vcard_content, encoding="utf-8")
+
+            opml_xml = generate_opml_from_vcards([vcard_path])
+
+        self.assertIn('<outline text="Doe, John"', opml_xml)
+
 
 if __name__ == "__main__":
     unittest.main()
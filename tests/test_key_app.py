@@ -13,7 +13,9 @@ class TestKeyAppCommands(unittest.TestCase):
             priv = Path(tmp_dir) / "private.pem"
             pub = Path(tmp_dir) / "public.pem"
 
-            with patch("src.dsipy.apps.key.action_generate_keypair") as mock_action:
+            with patch(
+                "src.dsipy.shared.security.action_generate_keypair"
+            ) as mock_action:
                 key.create.__wrapped__(priv=priv, pub=pub)
 
             mock_action.assert_called_once_with(priv, pub)
@@ -25,10 +27,12 @@ class TestKeyAppCommands(unittest.TestCase):
 
             with (
                 patch(
-                    "src.dsipy.apps.key.load_public_key_pem", return_value="pub-key"
+                    "src.dsipy.shared.security.load_public_key_pem",
+                    return_value="pub-key",
                 ) as mock_load,
                 patch(
-                    "src.dsipy.apps.key.public_key_to_b64der", return_value="BASE64_DER"
+                    "src.dsipy.shared.security.public_key_to_b64der",
+                    return_value="BASE64_DER",
                 ) as mock_b64,
                 patch("builtins.print") as mock_print,
             ):
@@ -50,7 +54,8 @@ class TestKeyAppCommands(unittest.TestCase):
     def test_decode_uses_argument_when_provided(self):
         with (
             patch(
-                "src.dsipy.apps.key.b64der_to_public_key", return_value="PEM_CONTENT"
+                "src.dsipy.shared.security.b64der_to_public_key",
+                return_value="PEM_CONTENT",
             ) as mock_decode,
             patch("builtins.print") as mock_print,
         ):
@@ -65,7 +70,8 @@ class TestKeyAppCommands(unittest.TestCase):
         with (
             patch("src.dsipy.apps.key.sys.stdin", fake_stdin),
             patch(
-                "src.dsipy.apps.key.b64der_to_public_key", return_value="PEM_FROM_STDIN"
+                "src.dsipy.shared.security.b64der_to_public_key",
+                return_value="PEM_FROM_STDIN",
             ) as mock_decode,
             patch("builtins.print") as mock_print,
         ):
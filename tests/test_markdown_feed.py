@@ -0,0 +1,171 @@
+import datetime
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.dsipy.apps.feeds.lib.markdown import MarkdownFeed
+
+
+class TestMarkdownFeedStateContent(unittest.TestCase):
+    def test_creates_front_matter_with_title_and_date(self):
+        content = MarkdownFeed._create_state_content(
+            "My Post", "Hello world", "2025-01-01T10:00:00Z"
+        )
+
+        self.assertEqual(
+            content,
+            "---\ntitle: My Post\ndate: 2025-01-01T10:00:00Z\n---\nHello world\n",
+        )
+
+    def test_skips_empty_attributes(self):
+        content = MarkdownFeed._create_state_content("", "Hello world")
+
+        self.assertEqual(content, "---\n\n---\nHello world\n")
+
+    def test_created_state_is_parsed_back(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "my-post.md"
+            state_path.write_text(
+                MarkdownFeed._create_state_content(
+                    "My Post", "Hello world", "2025-01-01T10:00:00Z"
+                ),
+                encoding="utf-8",
+            )
+
+            state = MarkdownFeed._parse_file(state_path)
+
+        self.assertEqual(state["title"], "My Post")
+        self.assertEqual(state["date"], datetime.datetime(2025, 1, 1, 10, 0, 0))
+        self.assertEqual(state["content"], "Hello world")
+        self.assertEqual(state["content_type"], "text")
+
+
+class TestMarkdownFeedParseDate(unittest.TestCase):
+    def test_parses_iso_dates(self):
+        self.assertEqual(
+            MarkdownFeed._parse_date("2025-01-05"), datetime.datetime(2025, 1, 5)
+        )
+        self.assertEqual(
+            MarkdownFeed._parse_date("2025-01-05T03:04:05Z"),
+            datetime.datetime(2025, 1, 5, 3, 4, 5),
+        )
+
+    def test_parses_non_zero_padded_dates(self):
+        self.assertEqual(
+            MarkdownFeed._parse_date("2025-1-5"), datetime.datetime(2025, 1, 5)
+        )
+        self.assertEqual(
+            MarkdownFeed._parse_date("2025-01-05T3:04:05Z"),
+            datetime.datetime(2025, 1, 5, 3, 4, 5),
+        )
+
+
+class TestMarkdownFeedCollectCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+        self.states_dir = self.tmp_dir / "states"
+        self.states_dir.mkdir()
+        self.cache_file = Path(tmp_dir.name) / "cache" / "parsed.json"
+
+        cache_patch = patch(
+            "src.dsipy.apps.feeds.lib.markdown.CACHE_FILE", self.cache_file
+        )
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def write_state(self, name, title, date="2025-01-01", states_dir=None):
+        path = (states_dir or self.states_dir) / name
+        path.write_text(
+            MarkdownFeed._create_state_content(title, "Hello world", date),
+            encoding="utf-8",
+        )
+        return path
+
+    def collect(self, states_dir=None):
+        with patch.object(
+            MarkdownFeed, "_parse_file", wraps=MarkdownFeed._parse_file
+        ) as parse_file:
+            states = MarkdownFeed.collect(states_dir or self.states_dir)
+        return states, [call.args[0] for call in parse_file.call_args_list]
+
+    def test_unchanged_files_are_read_from_the_cache(self):
+        self.write_state("first.md", "First", "2025-01-01")
+        self.write_state("second.md", "Second", "2025-01-02")
+
+        states, parsed = self.collect()
+        cached_states, cached_parsed = self.collect()
+
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual(cached_parsed, [])
+        self.assertEqual(cached_states, states)
+        self.assertEqual([state["title"] for state in states], ["Second", "First"])
+        self.assertEqual(states[0]["date"], datetime.datetime(2025, 1, 2))
+
+    def test_modified_files_are_parsed_again(self):
+        path = self.write_state("first.md", "First")
+        self.collect()
+
+        # Different size
+        self.write_state("first.md", "First edited")
+        states, parsed = self.collect()
+
+        self.assertEqual(parsed, [path])
+        self.assertEqual(states[0]["title"], "First edited")
+
+        # Same size, different modification time
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        _, parsed = self.collect()
+
+        self.assertEqual(parsed, [path])
+
+    def test_entries_of_removed_files_are_pruned(self):
+        self.write_state("first.md", "First")
+        removed = self.write_state("second.md", "Second")
+        self.collect()
+
+        removed.unlink()
+        states, _ = self.collect()
+
+        cache = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        cache = cache[str(self.states_dir)]
+        self.assertEqual(len(cache), 1)
+        self.assertFalse(any(key.startswith(f"{removed}:") for key in cache))
+        self.assertEqual([state["title"] for state in states], ["First"])
+
+    def test_directories_keep_their_own_entries(self):
+        other_dir = self.tmp_dir / "other"
+        other_dir.mkdir()
+        self.write_state("first.md", "First")
+        self.write_state("other.md", "Other", states_dir=other_dir)
+
+        _, parsed = self.collect()
+        _, other_parsed = self.collect(other_dir)
+        states, cached_parsed = self.collect()
+        other_states, other_cached_parsed = self.collect(other_dir)
+
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(len(other_parsed), 1)
+        self.assertEqual(cached_parsed, [])
+        self.assertEqual(other_cached_parsed, [])
+        self.assertEqual([state["title"] for state in states], ["First"])
+        self.assertEqual([state["title"] for state in other_states], ["Other"])
+
+    def test_invalid_cache_is_ignored(self):
+        self.write_state("first.md", "First")
+        self.cache_file.parent.mkdir(parents=True)
+        self.cache_file.write_text("[]", encoding="utf-8")
+
+        states, parsed = self.collect()
+
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(states[0]["title"], "First")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import datetime
+import unittest
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from src.dsipy.apps.feeds.lib.feed import (
+    RSSFeed,
+    media_content_element,
+    rss_date,
+    xml_cdata_element,
+    xml_element,
+)
+from src.dsipy.shared.security import verify_feed_signature
+
+
+class TestRssDate(unittest.TestCase):
+    def test_formats_rfc_822_date_in_gmt(self):
+        self.assertEqual(
+            rss_date(datetime.datetime(2025, 3, 2, 4, 5, 6)),
+            "Sun, 02 Mar 2025 04:05:06 GMT",
+        )
+        self.assertEqual(
+            rss_date(datetime.datetime(2024, 12, 31, 23, 59, 59)),
+            "Tue, 31 Dec 2024 23:59:59 GMT",
+        )
+
+    def test_missing_date(self):
+        self.assertIsNone(rss_date(None))
+
+
+class TestXmlElements(unittest.TestCase):
+    def test_escapes_text_and_attributes(self):
+        self.assertEqual(
+            xml_element("title", "A & <b>", {"keyId": 'x"y'}),
+            "<title keyId='x\"y'>A &amp; &lt;b&gt;</title>",
+        )
+
+    def test_omits_empty_elements(self):
+        self.assertEqual(xml_element("author", None), "")
+        self.assertEqual(xml_cdata_element("description", None), "")
+
+    def test_cdata_is_written_as_is(self):
+        self.assertEqual(
+            xml_cdata_element("description", "<![CDATA[<p>Hello & bye</p>]]>"),
+            "<description><![CDATA[<p>Hello & bye</p>]]></description>",
+        )
+
+    def test_escapes_text_around_cdata(self):
+        self.assertEqual(
+            xml_cdata_element("description", "a & b <![CDATA[<p>x</p>]]> c < d"),
+            "<description>a &amp; b <![CDATA[<p>x</p>]]> c &lt; d</description>",
+        )
+
+    def test_escapes_text_without_cdata(self):
+        self.assertEqual(
+            xml_cdata_element("description", "<p>x</p> ]]>"),
+            "<description>&lt;p&gt;x&lt;/p&gt; ]]&gt;</description>",
+        )
+
+    def test_media_content(self):
+        self.assertEqual(
+            media_content_element("https://example.com/image.png"),
+            '<media:content url="https://example.com/image.png" type="image/png" '
+            'medium="image"></media:content>',
+        )
+        self.assertEqual(
+            media_content_element("https://example.com/file.bin"),
+            '<media:content url="https://example.com/file.bin" '
+            'type="application/octet-stream" medium="unknown"></media:content>',
+        )
+
+
+class TestRSSFeedBuild(unittest.TestCase):
+    def setUp(self):
+        self.item = {
+            "id": "hello",
+            "title": "Hello",
+            "date": datetime.datetime(2025, 1, 5, 3, 4, 5),
+            "content": "Hello world",
+            "image": "https://example.com/video.mp4",
+        }
+
+    def build(self, items, sign=None):
+        return RSSFeed.build(
+            "My Title",
+            "https://example.org",
+            "My Description",
+            "Alice",
+            "alice@example.org",
+            "en-US",
+            datetime.datetime(2025, 1, 6),
+            items,
+            sign,
+        )
+
+    def test_builds_item(self):
+        rss = self.build([self.item])
+
+        self.assertTrue(rss.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<rss'))
+        self.assertIn(
+            "<item><title>Hello</title>"
+            "<link>https://example.org/feed/hello</link>"
+            "<description>Hello world</description>"
+            "<author>Alice (alice@example.org)</author>"
+            "<pubDate>Sun, 05 Jan 2025 03:04:05 GMT</pubDate>"
+            '<guid isPermaLink="false">hello</guid>'
+            '<media:content url="https://example.com/video.mp4" type="video/mp4" '
+            'medium="video"></media:content></item>',
+            rss,
+        )
+        self.assertIn(
+            "<lastBuildDate>Mon, 06 Jan 2025 00:00:00 GMT</lastBuildDate>", rss
+        )
+
+    def test_signs_items(self):
+        private_key = ed25519.Ed25519PrivateKey.generate()
+
+        rss = self.build([self.item], {"key": private_key, "id": "KEYID"})
+
+        start = rss.index('<signature keyId="KEYID">') + len(
+            '<signature keyId="KEYID">'
+        )
+        signature_hex = rss[start : rss.index("</signature>")]
+        self.assertTrue(
+            verify_feed_signature(
+                private_key.public_key(),
+                self.item["date"],
+                self.item["title"],
+                self.item["content"],
+                signature_hex,
+            )
+        )
+
+    def test_requires_title(self):
+        with self.assertRaises(ValueError):
+            RSSFeed.build(None, "https://example.org", "D", "A", "e", "en-US", None, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from src.dsipy.shared.security import (
+    canonical_endorsement_string,
+    public_key_to_b64der,
+    sign_endorsement,
+    verify_endorsement_signature,
+    verify_endorsements_batch,
+)
+
+
+class TestSignEndorsement(unittest.TestCase):
+    def setUp(self):
+        self.private_key = ed25519.Ed25519PrivateKey.generate()
+        self.endorsee_key_b64 = public_key_to_b64der(
+            ed25519.Ed25519PrivateKey.generate().public_key()
+        )
+
+    def test_canonical_endorsement_string(self):
+        self.assertEqual(canonical_endorsement_string("KEYB64"), b"endorse:KEYB64")
+
+    def test_endorsement_signature_is_verified(self):
+        signature_hex = sign_endorsement(self.private_key, self.endorsee_key_b64)
+
+        self.assertTrue(
+            verify_endorsement_signature(
+                self.private_key.public_key(), self.endorsee_key_b64, signature_hex
+            )
+        )
+
+    def test_verifies_with_base64_der_public_key(self):
+        signature_hex = sign_endorsement(self.private_key, self.endorsee_key_b64)
+
+        self.assertTrue(
+            verify_endorsement_signature(
+                public_key_to_b64der(self.private_key.public_key()),
+                self.endorsee_key_b64,
+                signature_hex,
+            )
+        )
+
+    def test_signature_for_another_key_is_rejected(self):
+        signature_hex = sign_endorsement(self.private_key, self.endorsee_key_b64)
+
+        self.assertFalse(
+            verify_endorsement_signature(
+                self.private_key.public_key(), "ANOTHERKEY", signature_hex
+            )
+        )
+
+    def test_batch_verifies_each_endorsement(self):
+        signature_hex = sign_endorsement(self.private_key, self.endorsee_key_b64)
+
+        results = verify_endorsements_batch(
+            public_key_to_b64der(self.private_key.public_key()),
+            [
+                (self.endorsee_key_b64, signature_hex),
+                (self.endorsee_key_b64, bytes.fromhex(signature_hex)),
+                ("ANOTHERKEY", signature_hex),
+            ],
+        )
+
+        self.assertEqual(results, [True, True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
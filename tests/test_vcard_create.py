@@ -0,0 +1,59 @@
+import os
+import signal
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from src.dsipy.apps import vcard
+
+
+class TestVCardCreateTempFile(unittest.TestCase):
+    def setUp(self):
+        self.runner = CliRunner()
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+        self.temp_file = Path(tmp_dir.name) / "vcard_create.tmp"
+
+    def test_saves_entries_when_prompts_are_aborted(self):
+        result = self.runner.invoke(vcard.app, ["create", "-i"], input="Alice\n")
+
+        self.assertNotIn("vCard generated", result.output)
+        self.assertIn("fn=Alice\n", self.temp_file.read_text(encoding="utf-8"))
+
+    def test_saves_entries_when_terminated(self):
+        def prompt(description, default=None):
+            if prompt.calls:
+                # Run the installed handler as if SIGTERM was received, without
+                # terminating the test runner if no handler is installed
+                handler = signal.getsignal(signal.SIGTERM)
+                self.assertTrue(callable(handler), "No SIGTERM handler installed")
+                handler(signal.SIGTERM, None)
+            prompt.calls += 1
+            return "Alice"
+
+        prompt.calls = 0
+        previous_handler = signal.getsignal(signal.SIGTERM)
+
+        with patch("src.dsipy.apps.vcard.typer.prompt", prompt):
+            result = self.runner.invoke(vcard.app, ["create", "-i"])
+
+        self.assertEqual(result.exit_code, 128 + signal.SIGTERM)
+        self.assertIn("fn=Alice\n", self.temp_file.read_text(encoding="utf-8"))
+        self.assertIs(signal.getsignal(signal.SIGTERM), previous_handler)
+
+    def test_resumes_from_saved_entries(self):
+        self.temp_file.write_text("fn=Alice\n", encoding="utf-8")
+
+        result = self.runner.invoke(vcard.app, ["create", "-i"], input="")
+
+        self.assertIn("[Alice]", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()